@@ -1,6 +1,7 @@
 import logging
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 
 from utils import utils
@@ -12,7 +13,6 @@ from utils.utils import (
     load_config,
     load_env,
     performance_metrics,
-    remove_duplicates,
     save_to_json,
     save_to_parquet,
     upload_file_s3,
@@ -42,19 +42,44 @@ def cred_parameters(page: str) -> tuple:
     return config, bucket_name, aws_access_key, aws_secret_key, base_url, search, typology
 
 
+def write_and_upload(
+    page: str,
+    data: list,
+    typology: str,
+    bucket_name: str,
+    aws_access_key: str,
+    aws_secret_key: str,
+) -> None:
+    """
+    Saves one part of the scraped listings to JSON and uploads that file to S3.
+
+    Parameters:
+    - page (str): The name of the page or platform scraped (e.g., 'imovirtual').
+    - data (list): The scraped listings, as (title, link) pairs.
+    - typology (str): The typology scraped.
+    - bucket_name (str): The name of the AWS S3 bucket.
+    - aws_access_key (str): The AWS access key.
+    - aws_secret_key (str): The AWS secret access key.
+    """
+    file_path = save_to_json(data, page, typology)
+    if file_path is not None:
+        upload_file_s3(bucket_name, aws_access_key, aws_secret_key, files=[file_path])
+
+
 @performance_metrics
-def extract(page: str) -> dict:
+def extract(page: str, params: tuple) -> dict:
     """
     Executes the scraping function based on the specified page, saves the scraped
     data to a JSON file, and uploads the JSON file to an AWS S3 bucket.
 
     Parameters:
     - page (str): The name of the page or platform to scrape (e.g., 'imovirtual').
+    - params (tuple): Credentials and parameters returned by `cred_parameters`.
 
     Returns:
     - None
     """
-    # Extract credentials and parameters
+    # Unpack credentials and parameters
     (
         config,
         bucket_name,
@@ -63,7 +88,7 @@ def extract(page: str) -> dict:
         base_url,
         search,
         typology,
-    ) = cred_parameters(page)
+    ) = params
 
     # Determine the scraping function to use
     func_name = page
@@ -77,33 +102,71 @@ def extract(page: str) -> dict:
     parts = 10
     pages_per_part = max_pages // parts
     all_data_dict = {}
+    # Links scraped so far, shared across parts so overlapping pages are not kept twice
+    seen_links = set()
+
+    # Files of the parquet dataset written by this run, uploaded together at the end
+    parquet_files = []
+    save_raw_json = config.get("output", {}).get("raw_json", True)
+
+    # Writing and uploading a part runs in the background while the next part is scraped
+    try:
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            pending = []
+
+            for part in range(parts):
+                start_page = part * pages_per_part + 1
+                end_page = (start_page + pages_per_part) if part < parts - 1 else max_pages + 1
+
+                # Call the scraping function with the current range of pages
+                data = func(base_url, typology, search, start_page, end_page - 1, seen=seen_links)
+
+                # Optional: Delay between parts to respect the server's load
+                time.sleep(1)
+
+                # Process the collected data; links are already unique across parts, as the
+                # scraper skips any link in seen_links
+                df = base_dataframe(data)
+
+                # Each part is added to the dataset as soon as it is enhanced, so a failure
+                # in a later part does not lose the detail pages already scraped
+                parquet_files.extend(save_to_parquet(page, intermediate_dataframe(df), part))
+
+                # The raw JSON tier is optional, the parquet dataset is built from the parts
+                if save_raw_json:
+                    pending.append(
+                        pool.submit(
+                            write_and_upload,
+                            page,
+                            data,
+                            typology,
+                            bucket_name,
+                            aws_access_key,
+                            aws_secret_key,
+                        )
+                    )
+
+            done, _ = wait(pending)
+            for future in done:
+                if future.exception() is not None:
+                    logging.error(f"Failed to save or upload part: {future.exception()}")
+    finally:
+        # An upload failure is logged rather than raised, so it cannot mask a scrape error
+        if parquet_files:
+            try:
+                upload_file_s3(
+                    bucket_name, aws_access_key, aws_secret_key, "parquet", files=parquet_files
+                )
+            except Exception as e:
+                logging.error(f"Failed to upload parquet dataset: {e}")
 
-    for part in range(parts):
-        start_page = part * pages_per_part + 1
-        end_page = (start_page + pages_per_part) if part < parts - 1 else max_pages + 1
-
-        # Call the scraping function with the current range of pages
-        data = func(base_url, typology, search, start_page, end_page - 1)
-
-        # Optional: Delay between parts to respect the server's load
-        time.sleep(1)
-
-        # Process the collected data
-        removed = remove_duplicates(data)
-        # all_data_dict.update(removed)
-        save_to_json(removed, page, typology)
-        upload_file_s3(bucket_name, aws_access_key, aws_secret_key)
-
-        df = base_dataframe(list(removed.items()))
-        df_enhanced = intermediate_dataframe(df)
-        save_to_parquet(page, df_enhanced, typology)
-        upload_file_s3(bucket_name, aws_access_key, aws_secret_key, "parquet")
     return all_data_dict
 
 
 def main(page: str):
     configure_logging()
-    extract(page)
+    params = cred_parameters(page)
+    extract(page, params)
 
 
 if __name__ == "__main__":
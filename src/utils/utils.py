@@ -1,60 +1,187 @@
+import atexit
 import functools
 import json
 import logging
 import os
+import queue
+import threading
 import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from types import MappingProxyType
 
-import boto3
-import numpy as np
 import pandas as pd
 import psutil
 import requests
 import yaml
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from dotenv import load_dotenv
-from memory_profiler import memory_usage
 from pandas import DataFrame
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Prefer the C-based lxml parser, falling back to the pure-Python one if it is missing
+try:
+    import lxml  # noqa: F401
+
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# Use the libyaml-backed C loader, warning when PyYAML was built without it
+try:
+    from yaml import CSafeLoader as YAML_LOADER
+except ImportError:
+    from yaml import SafeLoader as YAML_LOADER
+
+    logging.warning("libyaml not available; YAML parsing will be slow")
+
+# Headers to mimic a web browser, built once and shared read-only by every request
+HEADERS = MappingProxyType(
+    {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/107.0.0.0 Safari/537.36"
+    }
+)
+
+# Project root, resolved once rather than on every config lookup, log setup and upload
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Scraped data is kept under src/data whatever the working directory is
+DATA_DIR = PROJECT_ROOT / "src" / "data"
+
+# Performance metrics are opt-in, so undecorated calls cost nothing by default
+METRICS_ENABLED = os.getenv("HOUSEBUY_METRICS", "0") == "1"
+
+# Peak allocation tracing slows down every allocation, so it is opted into separately
+TRACE_MEMORY = os.getenv("HOUSEBUY_TRACE_MEMORY", "0") == "1"
+
+# Seconds to wait for a server response before giving up on a request
+REQUEST_TIMEOUT = 10
+
+# Restrict parsing to the subtrees each scraper reads from
+PAGINATION_STRAINER = SoupStrainer("li")
+LISTING_STRAINER = SoupStrainer("a")
+DETAILS_STRAINER = SoupStrainer(["div", "strong"])
+
+# Prefer the Rust-based orjson encoder, falling back to the standard library
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def configure_logging(log_file_path="logs/logfile.log") -> None:
     """
     Configures the logging for the application,
     directing logs to both a rotating file and standard output.
+    Records are handed to a background thread, so logging never blocks on I/O.
+    Only the first call has an effect; later calls return without adding handlers.
 
     Parameters:
     - log_file_path (str): Relative path from the project root to the log file.
     Defaults to "logs/logfile.log".
     """
-    # Get the absolute path of the directory where this script is located
-    current_script_path = Path(__file__).resolve()
-    project_root = current_script_path.parent.parent  # Adjust based on actual structure
+    if getattr(configure_logging, "_done", False):
+        return
 
-    # Construct an absolute path to the log file
-    absolute_log_file_path = project_root / log_file_path
+    # Construct an absolute path to the log file, relative to the src directory
+    absolute_log_file_path = PROJECT_ROOT / "src" / log_file_path
 
     # Ensure the log directory exists
     absolute_log_file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    logging.basicConfig(
-        level=logging.INFO,  # Adjust as needed
-        format="%(asctime)s %(levelname)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=[
-            RotatingFileHandler(
-                absolute_log_file_path, maxBytes=10485760, backupCount=5
-            ),  # 10MB file size
-            logging.StreamHandler(),  # Also log to stderr
-        ],
-    )
+    log_format = "%(asctime)s %(levelname)s: %(message)s"
+    date_format = "%Y-%m-%d %H:%M:%S"
+
+    formatter = logging.Formatter(log_format, datefmt=date_format)
+
+    file_handler = RotatingFileHandler(
+        absolute_log_file_path, maxBytes=10485760, backupCount=5
+    )  # 10MB file size
+    file_handler.setFormatter(formatter)
+
+    stream_handler = logging.StreamHandler()  # Also log to stderr
+    stream_handler.setFormatter(formatter)
+
+    # Callers only enqueue records; a background listener does the file and stream I/O
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # Replace any handlers already installed, e.g. by an implicit basicConfig from a
+    # logging call made before this function ran, so records are not emitted twice
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
+    root_logger.setLevel(logging.INFO)  # Adjust as needed
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    configure_logging._done = True
+
+
+def dumps_json(obj) -> bytes:
+    """
+    Serializes the given object to compact UTF-8 JSON, using orjson when it is installed
+    and the standard library otherwise.
+
+    Parameters:
+    - obj: The object to serialize.
+
+    Returns:
+    - bytes: The JSON document.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def write_json(data: list, file_path: Path) -> None:
+    """
+    Serializes the given data to a JSON file in a single write.
+
+    Parameters:
+    - data (list): The data to save.
+    - file_path (Path): The path of the JSON file.
+    """
+    file_path.write_bytes(dumps_json(data))
+
+
+@functools.lru_cache(maxsize=None)
+def get_metrics_file(path: str = "data/metrics/metrics.jsonl"):
+    """
+    Opens the metrics file once for appending, with a buffered writer closed at exit.
+
+    Parameters:
+    - path (str): Path of the JSON Lines file collecting the metrics of every call.
+
+    Returns:
+    - BufferedWriter: The open metrics file.
+    """
+    file_path = Path(path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    metrics_file = file_path.open("ab", buffering=1 << 16)
+    atexit.register(metrics_file.close)
+    return metrics_file
 
 
 def performance_metrics(func) -> callable:
     """
-    A decorator that measures and prints the performance metrics of the decorated function,
-    and saves these metrics to a JSON file in the 'metrics' folder.
+    A decorator that measures the performance metrics of the decorated function,
+    and appends these metrics to a JSON Lines file in the 'metrics' folder.
+
+    Metrics are only collected when the HOUSEBUY_METRICS environment variable is set to
+    "1" at import time; otherwise the function is returned undecorated, at no cost.
+    The peak Python allocation is only traced when HOUSEBUY_TRACE_MEMORY is also set to
+    "1", as tracemalloc inflates the recorded timings. It is only recorded for the
+    outermost decorated call, since a nested call would report the enclosing call's peak,
+    and is null otherwise.
 
     Parameters:
     - func (Callable): The function to measure. It can accept any number of positional
@@ -62,61 +189,109 @@ def performance_metrics(func) -> callable:
 
     Returns:
     - Callable: A wrapper function that, when called, executes the decorated function,
-      measures its performance, prints and saves its metrics, and returns the function's result.
+      measures its performance, saves its metrics, and returns the function's result.
     """
+    if not METRICS_ENABLED:
+        return func
 
     @functools.wraps(func)
     def wrapper_performance_metrics(*args, **kwargs):
-        # Record the start time and CPU times
-        start_time = time.time()
-        start_cpu = psutil.cpu_percent(interval=None)
-
-        # Record memory usage before execution
-        mem_before = memory_usage(-1, interval=0.1, timeout=1)
+        # Record the start resident memory, an O(1) snapshot
+        process = psutil.Process()
+        start_rss = process.memory_info().rss
+
+        # Trace Python allocations for the peak, leaving an enclosing trace running, then
+        # record the start process CPU time and wall time
+        started_tracing = TRACE_MEMORY and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        start_cpu = os.times()
+        start_process_time = time.process_time_ns()
+        start_time = time.perf_counter_ns()
 
         # Execute the function
         result = func(*args, **kwargs)
 
-        # Record the end time, CPU times, and memory usage after execution
-        end_time = time.time()
-        end_cpu = psutil.cpu_percent(interval=None)
-        mem_after = memory_usage(-1, interval=0.1, timeout=1)
-
-        # Calculate metrics
-        elapsed_time = end_time - start_time
-        cpu_usage = end_cpu - start_cpu
-        memory_used = max(mem_after) - min(mem_before)
+        # Record the end time, process CPU time, peak allocation and resident memory
+        elapsed_time = (time.perf_counter_ns() - start_time) / 1e9
+        process_time = (time.process_time_ns() - start_process_time) / 1e9
+        end_cpu = os.times()
+        cpu_user = end_cpu.user - start_cpu.user
+        cpu_system = end_cpu.system - start_cpu.system
+        peak_memory = tracemalloc.get_traced_memory()[1] / 1024**2 if started_tracing else None
+        if started_tracing:
+            tracemalloc.stop()
+        memory_used = (process.memory_info().rss - start_rss) / 1024**2
 
         # Prepare the metrics dictionary
         metrics = {
             "file_executed": func.__name__,
-            "date_executed": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "date_executed": datetime.now().isoformat(sep=" ", timespec="seconds"),
             "elapsed_time_seconds": elapsed_time,
-            "cpu_percent_usage": cpu_usage,
             "memory_usage_mb": memory_used,
+            "peak_memory_mb": peak_memory,
+            "cpu_user_seconds": cpu_user,
+            "cpu_system_seconds": cpu_system,
+            # os.times() only ticks every 10ms, so the percentage uses the finer process clock
+            "cpu_percent": 100 * process_time / elapsed_time if elapsed_time else 0.0,
         }
 
-        # Define the filename for the metrics JSON file
-        metrics_file_path = Path(
-            f"data/metrics/{func.__name__}_metrics_{datetime.now().strftime('%Y%m%d%H%M%S')}.json"
-        )
-
-        # Create the 'metrics' directory if it doesn't exist
-        metrics_file_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Save metrics to the JSON file
-        with metrics_file_path.open("w", encoding="utf-8") as f:
-            json.dump(metrics, f, ensure_ascii=False, indent=4)
+        # Append the metrics as one line to the shared metrics file
+        get_metrics_file().write(dumps_json(metrics) + b"\n")
 
         return result
 
     return wrapper_performance_metrics
 
 
-def load_config(filename="parameters.yaml") -> None or list:
+@functools.lru_cache(maxsize=8)
+def find_config(filename="parameters.yaml") -> Path or None:
+    """
+    Locate a configuration file in 'conf/base'. Searching the whole project for it is
+    only done when the LOAD_CONFIG_SEARCH environment variable is set to 1. The lookup is
+    cached, so the project tree is walked at most once per file.
+
+    Parameters:
+    - filename (str, optional): Name of the YAML configuration file. Defaults to "parameters.yaml".
+
+    Returns:
+    - Path: The path of the configuration file, or None if it was not found.
+    """
+    # Configurations are stored under conf/base, so look there before searching the project
+    config_path = PROJECT_ROOT / "conf" / "base" / filename
+    if config_path.is_file():
+        return config_path
+
+    if os.getenv("LOAD_CONFIG_SEARCH", "0") != "1":
+        return None
+
+    # If multiple configuration files are found, we simply take the first one found
+    return next(PROJECT_ROOT.rglob(filename), None)
+
+
+@functools.lru_cache(maxsize=16)
+def parse_yaml(path: str, mtime_ns: int) -> dict:
+    """
+    Parse a YAML file. Results are cached per path and modification time, so edits to
+    the file are picked up while unchanged files are only parsed once.
+
+    Parameters:
+    - path (str): Path of the YAML file.
+    - mtime_ns (int): Modification time of the file in nanoseconds, used as part of the
+      cache key.
+
+    Returns:
+    - dict: The parsed YAML content.
+    """
+    # libyaml decodes the raw bytes itself, skipping Python's text layer
+    with open(path, "rb") as file:
+        return yaml.load(file, Loader=YAML_LOADER)
+
+
+def load_config(filename="parameters.yaml") -> None or dict:
     """
     Dynamically load the YAML configuration file located in the 'conf' directory,
-    relative to this script's location.
+    relative to this script's location. Both the lookup and the parsing are cached.
 
     Parameters:
     - filename (str, optional): Name of the YAML configuration file. Defaults to "parameters.yaml".
@@ -124,27 +299,19 @@ def load_config(filename="parameters.yaml") -> None or list:
     Returns:
     - dict: The configuration parameters loaded from the YAML file.
     """
-    # Get project root
-    project_root = Path(__file__).resolve().parents[2]
+    config_path = find_config(filename)
 
-    # Find all instances of the configuration file within the project directory
-    config_files = list(project_root.glob(f"**/{filename}"))
-
-    if not config_files:
+    if config_path is None:
         logging.info(f"No configuration file named '{filename}' found in the project.")
         return None
 
-    # If multiple configuration files are found, you might want to select one based on some criteria
-    # Here, we simply take the first one found
-    config_path = config_files[0]
-
-    with open(config_path, "r", encoding="utf-8") as file:
-        return yaml.safe_load(file)
+    return parse_yaml(str(config_path), config_path.stat().st_mtime_ns)
 
 
+@functools.lru_cache(maxsize=1)
 def load_env() -> tuple:
     """
-    Load the .ENV configuration file.
+    Load the .ENV configuration file. The result is cached for the lifetime of the process.
 
     Parameters:
     - env_path (str): Path to the .env configuration file.
@@ -165,23 +332,121 @@ def load_env() -> tuple:
     return bucket_name, aws_access_key, aws_secret_key
 
 
-def get_headers() -> dict:
+def get_headers() -> MappingProxyType:
     """
-    Creates and returns headers to mimic a web browser for HTTP requests.
+    Returns headers to mimic a web browser for HTTP requests.
 
     Returns:
-        dict: Headers with a User-Agent key to mimic a web browser.
+        MappingProxyType: Read-only headers with a User-Agent key to mimic a web browser.
     """
-    return {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-        "(KHTML, like Gecko) Chrome/107.0.0.0 Safari/537.36"
+    return HEADERS
+
+
+@functools.lru_cache(maxsize=None)
+def get_session() -> requests.Session:
+    """
+    Returns the HTTP session shared by all scraping functions, so connections to
+    the same host are kept alive and reused across requests and threads. When
+    requests-cache is installed, responses are also cached on disk for an hour so
+    re-runs and retries do not fetch the same pages again.
+
+    Returns:
+        requests.Session: Session with the browser headers already set.
+    """
+    # requests-cache is imported on first use, as it loads boto3 for its DynamoDB backend
+    try:
+        from requests_cache import CachedSession
+
+        session = CachedSession(str(DATA_DIR / ".http_cache"), backend="sqlite", expire_after=3600)
+    except ImportError:
+        session = requests.Session()
+    session.headers.update(get_headers())
+    # Sized for the scraping thread pools; urllib3 retries connection errors, rate limiting
+    # and transient server errors with backoff
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_maxsize=32, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def fetch_pages(urls: list, max_workers: int = 32, requests_per_second: float = None) -> list:
+    """
+    Fetches the given URLs concurrently, preserving their order.
+
+    Parameters:
+    - urls (list): The URLs to fetch.
+    - max_workers (int): Maximum number of concurrent requests.
+    - requests_per_second (float): Maximum rate at which requests are started across all
+      workers, to stay polite to the host. No limit when not set.
+
+    Returns:
+    - list: The raw content of each page, or None where the request failed or the server
+      answered with an error status.
+    """
+    session = get_session()
+    interval = 1 / requests_per_second if requests_per_second else 0.0
+    lock = threading.Lock()
+    next_slot = time.monotonic()
+
+    def wait_for_slot():
+        nonlocal next_slot
+        with lock:
+            now = time.monotonic()
+            slot = max(next_slot, now)
+            next_slot = slot + interval
+        time.sleep(slot - now)
+
+    def fetch(url: str) -> bytes or None:
+        wait_for_slot()
+        try:
+            response = session.get(url, timeout=REQUEST_TIMEOUT)
+        except requests.exceptions.RequestException as e:
+            logging.error(f"Request failed: {e}")
+            return None
+
+        # Error pages are skipped rather than parsed as if they held listings
+        if not response.ok:
+            logging.warning(f"HTTP {response.status_code} for {url}")
+            return None
+        return response.content
+
+    if not urls:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        return list(executor.map(fetch, urls))
+
+
+def get_scraping_config(page: str) -> dict:
+    """
+    Returns the concurrency settings used to scrape the given page, as defined under the
+    `scraping` section of the parameters file.
+
+    Parameters:
+    - page (str): The name of the page or platform to scrape (e.g., 'imovirtual').
+
+    Returns:
+    - dict: Listing page workers and request rate, detail page workers and request rate.
+    """
+    settings = {
+        "max_workers": 8,
+        "requests_per_second": 8,
+        "detail_workers": 32,
+        "detail_requests_per_second": 8,
     }
+    config = load_config() or {}
+    settings.update(config.get("scraping", {}).get(page, {}))
+    return settings
 
 
 def find_element_after_sequence(values: list, seq: list) -> int or None:
     """
     Find the max page number per typology
 
+    The values are joined into one string so the sequence can be located with a single
+    str.find, using a separator that does not occur in the page text.
+
     Parameters:
     - values (list): List of values extracted from li tag.
     - seq (list): sequence to search for.
@@ -189,14 +454,16 @@ def find_element_after_sequence(values: list, seq: list) -> int or None:
     Returns:
         int: number of pages.
     """
-    # Find the start of the sequence
-    for i in range(len(values) - len(seq)):
-        # If the sequence matches
-        if values[i : i + len(seq)] == seq:
-            # Check if there is an element after the sequence
-            if i + len(seq) < len(values):
-                return int(values[i + len(seq)])
-    return None  # Return None if the sequence is not found or there is no element after
+    sep = "\x1f"
+    joined = sep + sep.join(values) + sep
+    needle = sep + sep.join(seq) + sep
+
+    index = joined.find(needle)
+    if index < 0:
+        return None  # The sequence is not found
+
+    after = joined[index + len(needle) :].split(sep, 1)[0]
+    return int(after) if after else None  # None if there is no element after the sequence
 
 
 def get_page_number(url: str, typology: str) -> int:
@@ -213,8 +480,10 @@ def get_page_number(url: str, typology: str) -> int:
     values = []
     full_url = f"{url}{typology}/?search[order]=created_at_first%3Adesc&page=1"
 
-    response = requests.get(full_url, headers=get_headers())
-    soup = BeautifulSoup(response.text, "html.parser")
+    response = get_session().get(full_url, timeout=REQUEST_TIMEOUT)
+    soup = BeautifulSoup(
+        response.content, HTML_PARSER, parse_only=PAGINATION_STRAINER, from_encoding="utf-8"
+    )
     li_tags = soup.find_all("li", class_="")
 
     if not li_tags:
@@ -230,7 +499,9 @@ def get_page_number(url: str, typology: str) -> int:
     return max_pages
 
 
-def imovirtual(url: str, typology: str, search: str, start_page: int, end_page: int) -> dict:
+def imovirtual(
+    url: str, typology: str, search: str, start_page: int, end_page: int, seen: set = None
+) -> list:
     """
     Scrapes listing titles and links from Imovirtual website until no more listings are found.
 
@@ -240,51 +511,70 @@ def imovirtual(url: str, typology: str, search: str, start_page: int, end_page:
     - search (str): The filter applied.
     - start_page (int): The number of the initial page to scrape.
     - end_page (int): The number of the final page to scrape.
+    - seen (set, optional): Links already scraped, e.g. by a previous range of pages.
+      Listings whose link is in it are skipped, and new links are added to it.
 
     Returns:
-    - data (dict): A dictionary with listing titles as keys and corresponding links.
-    """
-    title = []
-    links = []
+    - data (list): (title, link) pairs, in page order. Titles may repeat across listings.
+    """
+    data = []
+    seen = set() if seen is None else seen
+
+    pages = range(start_page, end_page + 1)
+    prefix = f"{url}{typology}{search}"
+    urls = [prefix + str(num) for num in pages]
+
+    # Fetch the pages concurrently, spacing request starts across all workers with the
+    # shared requests_per_second limiter
+    settings = get_scraping_config("imovirtual")
+    contents = fetch_pages(
+        urls,
+        max_workers=settings["max_workers"],
+        requests_per_second=settings["requests_per_second"],
+    )
 
-    for num in range(start_page, end_page + 1):
-        try:
-            page = requests.get(f"{url}{typology}{search}{num}", headers=get_headers())
-            soup = BeautifulSoup(page.text, "html.parser")
-            span_tags = soup.find_all("span", class_="offer-item-title")
+    for num, content in zip(pages, contents):
+        if content is None:
+            continue
 
-            if not span_tags:
-                logging.info(f"No results found at page {num}. Stopping.")
-                pass  # Exit the loop if no listings are found or if the same listings are repeated
+        soup = BeautifulSoup(
+            content, HTML_PARSER, parse_only=LISTING_STRAINER, from_encoding="utf-8"
+        )
+        found = False
 
-            for span_tag in span_tags:
-                title.append(span_tag.text.strip())
-                a_tag = span_tag.find_parent("a")
-                if a_tag and a_tag.has_attr("href"):
-                    links.append(a_tag["href"])
+        # Walk the anchors once, looking down for their title instead of up for the link
+        for a_tag in soup.find_all("a", href=True):
+            span_tag = a_tag.find("span", class_="offer-item-title")
+            if span_tag is None:
+                continue
 
-            time.sleep(1)  # Respectful delay between requests
+            found = True
+            if a_tag["href"] not in seen:
+                seen.add(a_tag["href"])
+                data.append((span_tag.text.strip(), a_tag["href"]))
 
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Request failed: {e}")
-            pass
+        if not found:
+            logging.info(f"No results found at page {num}.")
 
-    data = {title: link for title, link in zip(title, links)}
     return data
 
 
-def remove_duplicates(data: dict) -> dict:
+def remove_duplicates(data: list) -> list:
     """
-    Remove duplicate records in the dict
+    Remove duplicate records, keeping the first title seen for each link.
 
     Parameters:
-    - data (dict): The data to save, with titles as keys and links as values.
+    - data (list): (title, link) pairs.
 
     Returns:
-    - res (dict): duplicate removed
-    """
-    temp = {val: key for key, val in data.items()}
-    res = {val: key for key, val in temp.items()}
+    - res (list): (title, link) pairs, duplicate removed
+    """
+    seen = set()
+    res = []
+    for key, val in data:
+        if val not in seen:
+            seen.add(val)
+            res.append((key, val))
     return res
 
 
@@ -298,9 +588,10 @@ def json_to_list(json_file: str) -> list:
     Returns:
     - list
     """
-    f = open(json_file)
-    data = json.load(f)
-    return list(data.items())
+    content = Path(json_file).read_bytes()
+    data = orjson.loads(content) if orjson is not None else json.loads(content)
+    # Older raw files map titles to links, newer ones hold (title, link) pairs
+    return list(data.items()) if isinstance(data, dict) else [tuple(pair) for pair in data]
 
 
 def base_dataframe(json_file: list) -> DataFrame:
@@ -308,7 +599,7 @@ def base_dataframe(json_file: list) -> DataFrame:
     Create base DataFrame with title and url
 
     Parameters:
-    - json_file (str): The path of the JSON file
+    - json_file (list): (title, url) pairs.
 
     Returns:
     - Dataframe
@@ -328,8 +619,13 @@ def scrape_data(url: str, tag: str, class_name: str) -> list:
     Returns:
     - list
     """
-    page = requests.get(url, headers=get_headers())
-    soup = BeautifulSoup(page.content, "html.parser")
+    page = get_session().get(url, timeout=REQUEST_TIMEOUT)
+    soup = BeautifulSoup(
+        page.content,
+        HTML_PARSER,
+        parse_only=SoupStrainer(tag, class_=class_name),
+        from_encoding="utf-8",
+    )
     return [element.text.strip() for element in soup.find_all(tag, class_=class_name)]
 
 
@@ -351,13 +647,8 @@ def intermediate_dataframe(df: DataFrame) -> DataFrame:
         "prices_m2": ("div", "css-1h1l5lm efcnut39"),
     }
 
-    # Pre-define new columns to avoid dynamic assignment within the loop
-    new_columns = [
-        "full_address",
-        "prices",
-        "prices_m2",
-        "city",
-        "state",
+    # Additional details listed as key/value pairs on the listing page
+    detail_columns = [
         "Área (m²)",
         "Certificado Energético",
         "Tipo",
@@ -366,22 +657,31 @@ def intermediate_dataframe(df: DataFrame) -> DataFrame:
         "Condição",
         "Acompanhamento Virtual",
     ]
-    for col in new_columns:
-        df[col] = np.nan
-
-    # Bulk scrape and process data
-    for index, row in df.iterrows():
-        # Scrape once per URL and update DataFrame with all data mappings
-        url = row["url"]
-        response = requests.get(url, headers=get_headers())
-        soup = BeautifulSoup(response.content, "html.parser")
-
-        # Assuming scrape_data is a function that extracts data based on tag and class_name
-        # Here you would replace scrape_data with the actual scraping logic
+    records = []
+
+    # Fetch every listing concurrently, rate-limited like the listing pages, then parse
+    urls = df["url"].tolist()
+    settings = get_scraping_config("imovirtual")
+    contents = fetch_pages(
+        urls,
+        max_workers=settings["detail_workers"],
+        requests_per_second=settings["detail_requests_per_second"],
+    )
+    for url, content in zip(urls, contents):
+        record = {"url": url}
+        records.append(record)
+
+        if content is None:
+            continue
+
+        soup = BeautifulSoup(
+            content, HTML_PARSER, parse_only=DETAILS_STRAINER, from_encoding="utf-8"
+        )
+
         for key, (tag, class_name) in data_mappings.items():
             element = soup.find(tag, class_=class_name)
             if element:
-                df.at[index, key] = element.get_text(strip=True)
+                record[key] = element.get_text(strip=True)
 
         # Data extraction for the additional details
         keys = [
@@ -390,91 +690,206 @@ def intermediate_dataframe(df: DataFrame) -> DataFrame:
         values = [
             v.get_text().strip() for v in soup.find_all("div", class_="css-1ytkscc e1qm3vsd3")
         ]
-        extracted_data = dict(zip(keys, values))
+        record.update((k, v) for k, v in zip(keys, values) if k in detail_columns)
 
-        # Update DataFrame
-        for key, value in extracted_data.items():
-            if key in df.columns:
-                df.at[index, key] = value
+    # Arrow-backed strings are smaller and faster on the .str operations below
+    extra = (
+        pd.DataFrame.from_records(records, columns=["url", *data_mappings, *detail_columns])
+        .set_index("url")
+        .astype("string[pyarrow]")
+    )
+    df = df.join(extra, on="url")
 
     # Data cleaning
-    df["prices_m2"] = df["prices_m2"].str.replace(" €/m²", "", regex=True)
-    df["prices"] = df["prices"].str.replace(" €", "", regex=True)
+    df["prices_m2"] = df["prices_m2"].str.replace(" €/m²", "", regex=False)
+    df["prices"] = df["prices"].str.replace(" €", "", regex=False)
 
-    # Address processing
-    df["city"] = df["full_address"].str.split(",").str[-2].str.strip()
-    df["state"] = df["full_address"].str.split(",").str[-1].str.strip()
+    # Address processing, splitting each address only once
+    address_parts = df["full_address"].str.rsplit(",", n=2)
+    df["city"] = address_parts.str[-2].str.strip().astype("string[pyarrow]")
+    df["state"] = address_parts.str[-1].str.strip().astype("string[pyarrow]")
     return df
 
 
-def save_to_json(data: dict, page: str, typology: str) -> None:
+def save_to_json(data: list, page: str, typology: str) -> Path or None:
     """
     Saves the given data to a JSON file. If the target directory doesn't exist,
     it will be created.
 
     Parameters:
-    - data (dict): The data to save, with titles as keys and links as values.
+    - data (list): The data to save, as (title, link) pairs.
     - page (str): The path to the JSON file where the data will be saved.
     - typology (str): The typology to scrape, formatted to include pagination.
+
+    Returns:
+    - Path: The path of the written file, or None if it could not be saved.
     """
-    # Ensure file_path is a Path object
-    file_path = Path(f"data/raw/{page}_{typology}_{datetime.now().strftime('%Y%m%d%H%M%S')}.json")
+    file_name = f"{page}_{typology}_{datetime.now().strftime('%Y%m%d%H%M%S')}.json"
+    file_path = DATA_DIR / "raw" / file_name
     # Create the target directory if it doesn't exist
     file_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Attempt to save the data to the specified file
+    # Attempt to save the data to the specified file, as compact one-line JSON
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+        write_json(data, file_path)
     except Exception as e:
         logging.error(f"Error saving data to JSON: {e}")
+        return None
+    return file_path
 
 
-def save_to_parquet(page: str, df: DataFrame, typology: str) -> None:
+def save_to_parquet(page: str, df: DataFrame, part: int = 0) -> list:
     """
-    Saves the given data to a PARQUET file.
+    Saves the given data to a PARQUET dataset under src/data/processed/<page>, partitioned
+    by scrape date in the hive layout. Files are compressed with zstd and split into
+    row groups, so later reads can prune partitions, columns and row groups.
+    Each call adds new files to the dataset, so it can be called once per scraped part.
 
     Parameters:
-    - page (str): The path to the JSON file where the data will be saved.
+    - page (str): The name of the page or platform scraped.
     - df (DataFrame): The DF that will be saved.
-    - dest (str): Path of the destination
+    - part (int, optional): The number of the scraped part, used to name the files.
+
+    Returns:
+    - list: The paths of the files written.
+    """
+    # pyarrow is imported on first use, as it is only needed once results are saved
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    now = datetime.now()
+    output_dir = DATA_DIR / "processed" / page
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    written = []
+    table = pa.Table.from_pandas(df.assign(date=now.strftime("%Y-%m-%d")), preserve_index=False)
+    ds.write_dataset(
+        table,
+        output_dir,
+        format="parquet",
+        partitioning=["date"],
+        partitioning_flavor="hive",
+        basename_template=f"part-{now.strftime('%Y%m%d%H%M%S')}-{part}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        max_rows_per_file=100_000,
+        max_rows_per_group=50_000,
+        file_options=ds.ParquetFileFormat().make_write_options(
+            compression="zstd", compression_level=3, use_dictionary=True, write_statistics=True
+        ),
+        file_visitor=lambda written_file: written.append(Path(written_file.path)),
+    )
+    return written
+
+
+@functools.lru_cache(maxsize=4)
+def get_s3_client(access_key: str, secret_key: str):
     """
-    df = pd.DataFrame(df)
-    output_file = Path(
-        f"data/processed/df_{page}_{typology}_{datetime.now().strftime('%Y%m%d%H%M%S')}.parquet.gzip"
+    Returns an S3 client shared by every upload made with the same credentials, so its
+    connection pool stays warm across calls and background workers.
+
+    Parameters:
+    - access_key (str): The AWS access key.
+    - secret_key (str): The AWS secret access key.
+
+    Returns:
+    - S3.Client: Thread-safe client with a connection pool sized for concurrent uploads.
+    """
+    # boto3 is imported on first use, as it is only needed once results are uploaded
+    import boto3
+    from botocore.config import Config as BotoConfig
+
+    # A dedicated session keeps client creation safe when called from several threads
+    return boto3.session.Session().client(
+        "s3",
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        config=BotoConfig(max_pool_connections=32),
     )
-    output_file.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(output_file, compression="gzip")
 
 
-def upload_file_s3(bucket_name: str, access_key: str, secret_key: str, kind: str = "json") -> None:
+def get_transfer_config(kind: str = "json"):
     """
-    Uploads all JSON files in the src/data/raw directory to an AWS S3 bucket.
+    Build the boto3 transfer configuration for the given data format, using the
+    multipart settings defined under the `s3` section of the parameters file.
+
+    Parameters:
+    - kind (str): Data format to upload ("json" or "parquet").
+
+    Returns:
+    - TransferConfig: Multipart threshold, chunk size and concurrency for the uploads.
+    """
+    from boto3.s3.transfer import TransferConfig
+
+    config = load_config() or {}
+    settings = config.get("s3", {}).get("json" if kind.lower() == "json" else "parquet", {})
+    return TransferConfig(use_threads=True, **settings)
+
+
+def upload_file_s3(
+    bucket_name: str,
+    access_key: str,
+    secret_key: str,
+    kind: str = "json",
+    max_workers: int = 16,
+    attempts: int = 3,
+    files: list = None,
+) -> None:
+    """
+    Uploads all JSON files in the src/data/raw directory, or all parquet files of the
+    datasets in src/data/processed, to an AWS S3 bucket. When `files` is given, only
+    those files are uploaded.
+
+    The uploads are network bound, so they are dispatched concurrently through a
+    thread pool sharing a single, cached S3 client. Large files are sent as multipart uploads
+    according to the `s3` settings in the parameters file.
 
     Parameters:
     - bucket_name (str): The name of the AWS S3 bucket.
     - access_key (str): The AWS access key.
     - secret_key (str): The AWS secret access key.
     - kind (str): Data format to upload
+    - max_workers (int): Maximum number of concurrent uploads.
+    - attempts (int): Number of tries per file, backing off exponentially between them.
+    - files (list, optional): Paths of the files to upload, which must be inside the data
+      directory of the given kind. Defaults to every file of that kind.
     """
-    s3 = boto3.client("s3", aws_access_key_id=access_key, aws_secret_access_key=secret_key)
-
-    # Get project root and construct path to the raw data directory
-    project_root = Path(__file__).resolve().parents[2]
+    s3 = get_s3_client(access_key, secret_key)
+    transfer_config = get_transfer_config(kind)
 
-    file_ext = "*.json" if kind.lower() == "json" else "*.gzip"
+    file_ext = "*.json" if kind.lower() == "json" else "*.parquet"
     dir_name = "raw" if kind.lower() == "json" else "processed"
 
-    raw_data_dir = project_root / "src" / "data" / dir_name
+    # Construct path to the raw data directory
+    raw_data_dir = DATA_DIR / dir_name
 
-    if raw_data_dir.exists():
-        files = list(raw_data_dir.glob(file_ext))
+    if not raw_data_dir.exists():
+        return
+
+    # Parquet datasets are partitioned into subdirectories, which are kept in the keys
+    if files is None:
+        files = list(raw_data_dir.rglob(file_ext))
+    else:
+        files = [Path(file).resolve() for file in files]
+    if not files:
+        return
 
-        for file in files:
-            file_key = f"{dir_name}/{file.name}"
+    def upload(file: Path) -> None:
+        # A file outside the data directory is logged and skipped, not left to abort the map
+        try:
+            file_key = f"{dir_name}/{file.relative_to(raw_data_dir).as_posix()}"
+        except ValueError:
+            logging.error(f"Not uploading {file}: it is not inside {raw_data_dir}")
+            return
+
+        for attempt in range(attempts):
             try:
-                s3.upload_file(str(file), bucket_name, file_key)
+                s3.upload_file(str(file), bucket_name, file_key, Config=transfer_config)
+                return
             except Exception as e:
-                logging.error(f"Failed to upload {file.name}: {e}")
-    else:
-        pass
+                if attempt == attempts - 1:
+                    logging.error(f"Failed to upload {file.name}: {e}")
+                else:
+                    time.sleep(2**attempt)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as executor:
+        list(executor.map(upload, files))